@@ -0,0 +1 @@
+export const BLOCKED_RESOURCE_TYPES = new Set(['image', 'media', 'font']);
\ No newline at end of file
@@ -0,0 +1,7 @@
+import { SUPPORT_SHOP_NAME } from "./support-shop.constant.js";
+import { St11 } from "../helpers/st11.helper.js";
+import type { CrawlerHelperConstructor } from "../interface/crawler-helper.interface.js";
+
+export const CRAWLER_HELPER_LIST: Record<string, CrawlerHelperConstructor> = {
+  [SUPPORT_SHOP_NAME["11st"]]: St11,
+};
\ No newline at end of file
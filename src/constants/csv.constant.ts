@@ -0,0 +1 @@
+export const REVIEW_CSV_COLUMNS = ['author', 'score', 'content', 'createdAt'] as const;
\ No newline at end of file
@@ -4,6 +4,8 @@ export const SUPPORT_SHOP_NAME = {
 
 export const SUPPORT_SHOP_LIST = {
   [SUPPORT_SHOP_NAME["11st"]]: {
-    url: 'https://www.11st.co.kr/products',
+    url: 'https://www.11st.co.kr/products/',
   },
-};
\ No newline at end of file
+};
+
+export const SUPPORT_SHOP_URL_LIST = Object.values(SUPPORT_SHOP_LIST).map((shop) => shop.url);
\ No newline at end of file
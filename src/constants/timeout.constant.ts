@@ -0,0 +1,2 @@
+export const NAVIGATION_TIMEOUT = 30_000;
+export const ELEMENT_TIMEOUT = 10_000;
\ No newline at end of file
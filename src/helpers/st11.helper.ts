@@ -1,11 +1,28 @@
-import { FrameLocator, Locator, Page } from "playwright";
-import { Review } from "../types/review.type.js";
-import { CrawlerHelper } from "../interface/crawler-helper.interface.js";
+import type { FrameLocator, Page } from "playwright";
+import type { Review } from "../types/review.type.js";
+import type { CrawlerHelper } from "../interface/crawler-helper.interface.js";
+import { ensureOutputDirectory, escapeCSVField, getProductId, RUN_TIMESTAMP, toSafeFileName } from "../utils/common.js";
+import { extractFields } from "../utils/extract.js";
+import { debug, log } from "../utils/logger.js";
+import { NAVIGATION_TIMEOUT } from "../constants/timeout.constant.js";
+import { REVIEW_CSV_COLUMNS } from "../constants/csv.constant.js";
 import moment from "moment";
-import path from "path";
-import { mkdir, writeFileSync } from "fs";
 import { writeFile } from "fs/promises";
 
+const REVIEW_DATE_FORMAT = 'YYYY.MM.DD';
+const REVIEW_TAB_SELECTOR = '#tabMenuDetail2';
+const REVIEW_FRAME_SELECTOR = '#ifrmReview';
+const REVIEW_LIST_SELECTOR = '#review-list-page-area';
+const REVIEW_CONTAINER_SELECTOR = `${REVIEW_LIST_SELECTOR} .area_list:not([data-crawl])`;
+const REVIEW_ITEM_SELECTOR = '.review_list_element';
+const REVIEW_FIELD_SELECTORS = {
+  name: '.c_product_reviewer .name',
+  score: '.c_product_review_cont .c_seller_grade em',
+  content: '.c_product_review_cont .cont_review_hide',
+  date: '.date',
+};
+const LOAD_MORE_BUTTON_SELECTOR = 'button[name="review_more"]';
+
 export class St11 implements CrawlerHelper {
   private page: Page;
   private collection: Review[] = [];
@@ -19,91 +36,57 @@ export class St11 implements CrawlerHelper {
   }
 
   async getReviewList() {
-    await this.page.goto(this.url);
-    const tabButton = await this.page.waitForSelector('#tabMenuDetail2');
-
-    await tabButton.click();
+    await this.page.goto(this.url, { waitUntil: 'domcontentloaded' });
+    await this.page.locator(REVIEW_TAB_SELECTOR).click({ timeout: NAVIGATION_TIMEOUT });
 
-    const reviewFrame = await this.page.frameLocator('#ifrmReview');
+    const reviewFrame = this.page.frameLocator(REVIEW_FRAME_SELECTOR);
+    await reviewFrame.locator(REVIEW_LIST_SELECTOR).waitFor({ timeout: NAVIGATION_TIMEOUT });
+    const destination = await this.createCSV();
 
     while (true) {
-      await this.getReviewContentInElement(reviewFrame);
+      const reviews = await this.getReviewContentInElement(reviewFrame);
+      await this.appendCSV(destination, reviews);
+
       let isContinue = false;
       if (this.collection.length < this.maxCount) isContinue = await this.loadMoreReviews(reviewFrame);
 
       if (!isContinue) break;
     }
 
-    await this.exportCSV(this.collection);
-
     return this.collection;
   }
 
   private async getReviewContentInElement(frame: FrameLocator) {
-    const reviewContainerElement = await frame.locator('#review-list-page-area .area_list:not([data-crawl])');
+    const start = this.collection.length;
+    const reviewContainerElement = frame.locator(REVIEW_CONTAINER_SELECTOR);
     await reviewContainerElement.waitFor({ state: 'visible' });
 
-    console.log('Review Container Element: ', await reviewContainerElement.isVisible());
-    
+    const rows = await extractFields(reviewContainerElement.locator(REVIEW_ITEM_SELECTOR), REVIEW_FIELD_SELECTORS);
+
     await reviewContainerElement.evaluate((el) => {
       el.setAttribute('data-crawl', 'true');
     });
 
-    const elements = await frame.locator('#review-list-page-area .area_list:not([data-crawl]) .review_list_element').all();
-    console.log('Elements: ', elements.length);
-    console.log(`Found ${elements.length} reviews...`);
-    for (const element of elements) {
+    debug('Found', rows.length, 'reviews...');
+    for (const { name, score, content, date } of rows) {
       if (this.collection.length >= this.maxCount) break;
-
-      console.log('--------------------------------');
-      console.log(`Start Crawling Review... ${this.collection.length} / ${this.maxCount}`);
-
-      console.log('Element Visible: ', await element.isVisible());
-
-      await element.scrollIntoViewIfNeeded();
-
-      const nameFieldClassName = '.c_product_reviewer .name';
-      const scoreFieldClassName = '.c_product_review_cont .c_seller_grade em';
-      const contentFieldClassName = '.c_product_review_cont .cont_review_hide';
-      const dateFieldClassName = '.date';
-
-      let name: string;
-      let score: string;
-      let content: string;
-      let date: string;
-      let formattedDate: Date;
-
-      try {
-        name = (await element.locator(nameFieldClassName).textContent())?.trim() as string;
-        console.log('Got Name: ', name);
-        score = (await element.locator(scoreFieldClassName).textContent())?.trim() as string;
-        console.log('Got Score: ', score);
-        content = (await element.locator(contentFieldClassName).textContent())?.trim() as string;
-        console.log('Got Content: ', content);
-        date = (await element.locator(dateFieldClassName).textContent())?.trim() as string;
-        console.log('Got Date: ', date);
-        formattedDate = moment(date).toDate();
-      } catch (error) {
-        console.log(error);
-        continue;
-      }
+      if (name === null || score === null || content === null || date === null) continue;
 
       this.collection.push({
         author: name,
         score,
         content,
-        createdAt: formattedDate,
+        createdAt: moment(date, REVIEW_DATE_FORMAT).toDate(),
       });
     }
-    console.log('--------------------------------');
-    console.log('End Crawling Review');
+    log(`End Crawling Review... ${this.collection.length} / ${this.maxCount}`);
 
-    return this.collection;
+    return this.collection.slice(start);
   }
 
   private async loadMoreReviews(frame: FrameLocator) {
-    console.log('Load Next Page');
-    const loadMoreButton = await frame.locator('button[name="review_more"]');
+    debug('Load Next Page');
+    const loadMoreButton = frame.locator(LOAD_MORE_BUTTON_SELECTOR);
 
     if (await loadMoreButton.isVisible()) {
       await loadMoreButton.click();
@@ -113,20 +96,20 @@ export class St11 implements CrawlerHelper {
     }
   }
 
-  private async exportCSV(reviews: Review[]) {
-    const pathname = path.join(process.cwd(), `output`);
-    const destination = `${pathname}/${moment().format('YYYY-MM-DD_HH-mm-ss')}-11st-reviews.csv`;
+  private async createCSV() {
+    const pathname = await ensureOutputDirectory();
+    const destination = `${pathname}/${RUN_TIMESTAMP}-11st-${toSafeFileName(getProductId(this.url))}-reviews.csv`;
 
-    await mkdir(pathname, { recursive: true }, (err) => {
-      if (err) console.error(err);
-    });
-
-    await writeFile(destination, 'author,score,content,createdAt\n');
+    await writeFile(destination, `\ufeff${REVIEW_CSV_COLUMNS.join(',')}\n`, { encoding: 'utf8', flag: 'wx' });
 
-    for (const review of reviews) {
-      await writeFile(destination, `${review.author},${review.score},${review.content},${review.createdAt}\n`, { flag: 'a', encoding: 'utf8' });
-    }
-    
     return destination
   }
+
+  private async appendCSV(destination: string, reviews: Review[]) {
+    if (reviews.length === 0) return;
+
+    const rows = reviews.map((review) => REVIEW_CSV_COLUMNS.map((column) => escapeCSVField(review[column])).join(','));
+
+    await writeFile(destination, `${rows.join('\n')}\n`, { flag: 'a', encoding: 'utf8' });
+  }
 }
\ No newline at end of file
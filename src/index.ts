@@ -1,38 +1,125 @@
-import { chromium } from 'playwright';
+import type { Page } from 'playwright';
 import { Command } from 'commander';
 import { SUPPORT_URL_SCHEMA } from './schema/support-url.schema.js';
-import { getSiteName } from './utils/common.js';
-import { SUPPORT_SHOP_NAME } from './constants/support-shop.constant.js';
-import { St11 } from './helpers/st11.helper.js';
-import { CrawlerHelper } from './interface/crawler-helper.interface.js';
+import { getProductId, getSiteName, toPositiveInteger } from './utils/common.js';
+import { log, runWithLogContext } from './utils/logger.js';
+import { BLOCKED_RESOURCE_TYPES } from './constants/browser.constant.js';
+import { ELEMENT_TIMEOUT, NAVIGATION_TIMEOUT } from './constants/timeout.constant.js';
 
 (async () => {
   const program = new Command();
-  const browser = await chromium.launch({
-    headless: false,
-  });
 
   program
-    .requiredOption('-u, --url <url>', '해당 상품의 URL로 접속합니다.')
-    .requiredOption('-m, --max-count <maxCount>', '크롤링 할 리뷰의 갯수를 지정합니다.');
+    .requiredOption('-u, --url <url...>', '해당 상품의 URL로 접속합니다. 여러 개를 지정할 수 있습니다.')
+    .requiredOption('-m, --max-count <maxCount>', '크롤링 할 리뷰의 갯수를 지정합니다.')
+    .option('-c, --concurrency <concurrency>', '동시에 크롤링 할 상품의 갯수를 지정합니다.', '1');
 
   program.parse(process.argv);
 
-  const { url, maxCount } = program.opts();
-  const parsedUrl = SUPPORT_URL_SCHEMA.safeParse(url);
+  const options: { url: string[]; maxCount: string; concurrency: string } = program.opts();
+  const urls = options.url;
+  const maxCount = toPositiveInteger(options.maxCount, '크롤링 할 리뷰의 갯수는 1 이상의 정수여야 합니다.');
+  const concurrency = toPositiveInteger(options.concurrency, '동시에 크롤링 할 상품의 갯수는 1 이상의 정수여야 합니다.');
+
+  const targetMap = new Map<string, { url: string; siteName: string }>();
+
+  for (const url of urls) {
+    const parsedUrl = SUPPORT_URL_SCHEMA.safeParse(url);
+
+    if (parsedUrl.success === false) throw new Error(parsedUrl.error.message);
+
+    const siteName = getSiteName(url);
+    const key = `${siteName}/${getProductId(url)}`;
 
-  if (parsedUrl.success === false) throw new Error(parsedUrl.error.message);
+    const duplicate = targetMap.get(key);
 
-  let crawler: CrawlerHelper;
-  const context = await browser.newContext();
-  const page = await context.newPage();
+    if (duplicate !== undefined) {
+      log(`Skipping ${url}: same product as ${duplicate.url}`);
+      continue;
+    }
+
+    targetMap.set(key, { url, siteName });
+  }
+
+  const targets = Array.from(targetMap.values());
+
+  const { chromium } = await import('playwright');
+  const { CRAWLER_HELPER_LIST } = await import('./constants/crawler-helper.constant.js');
+  const browser = await chromium.launch({
+    headless: false,
+  });
 
-  const siteName = getSiteName(url);
+  const crawl = async (page: Page, { url, siteName }: (typeof targets)[number]) => {
+    const crawler = new CRAWLER_HELPER_LIST[siteName](page, url, maxCount);
 
-  console.log(`Crawling ${url}...`);
+    log(`Crawling ${url}...`);
 
-  if (siteName === SUPPORT_SHOP_NAME["11st"]) {
-    crawler = new St11(page, url, maxCount);
     await crawler.getReviewList(maxCount);
+  };
+
+  const clearWebStorage = async (page: Page) => {
+    await Promise.all(page.frames().map((frame) => frame.evaluate(() => {
+      localStorage.clear();
+      sessionStorage.clear();
+    }).catch(() => undefined)));
+  };
+
+  const queue = targets.slice();
+  const failedUrls: string[] = [];
+  const workers = Array.from({ length: Math.min(concurrency, queue.length) }, async () => {
+    const context = await browser.newContext();
+
+    try {
+      context.setDefaultNavigationTimeout(NAVIGATION_TIMEOUT);
+      context.setDefaultTimeout(ELEMENT_TIMEOUT);
+      await context.route('**/*', (route) => {
+        if (BLOCKED_RESOURCE_TYPES.has(route.request().resourceType())) return route.abort();
+
+        return route.continue();
+      });
+
+      while (true) {
+        const target = queue.shift();
+
+        if (target === undefined) break;
+
+        await runWithLogContext(target.url, async () => {
+          let page: Page | undefined;
+
+          try {
+            page = await context.newPage();
+            await crawl(page, target);
+          } catch (error) {
+            failedUrls.push(target.url);
+            log('Failed to crawl:', error instanceof Error ? error.message : error);
+          } finally {
+            if (page !== undefined) {
+              await clearWebStorage(page);
+              await page.close().catch((error) => log('Failed to close page:', error instanceof Error ? error.message : error));
+            }
+          }
+        });
+        await context.clearCookies();
+      }
+    } finally {
+      await context.close();
+    }
+  });
+
+  try {
+    const results = await Promise.allSettled(workers);
+
+    for (const result of results) {
+      if (result.status === 'rejected') log('Crawler worker stopped:', result.reason);
+    }
+  } finally {
+    await browser.close();
+  }
+
+  failedUrls.push(...queue.map((target) => target.url));
+
+  if (failedUrls.length > 0) {
+    log(`Failed to crawl ${failedUrls.length} product(s):`, failedUrls.join(', '));
+    process.exitCode = 1;
   }
 })();
\ No newline at end of file
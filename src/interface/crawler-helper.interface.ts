@@ -1,6 +1,10 @@
-import { Page } from "playwright";
-import { Review } from "../types/review.type.js";
+import type { Page } from "playwright";
+import type { Review } from "../types/review.type.js";
 
 export interface CrawlerHelper {
   getReviewList(maxCount: number): Promise<Review[]>;
+}
+
+export interface CrawlerHelperConstructor {
+  new (page: Page, url: string, maxCount: number): CrawlerHelper;
 }
\ No newline at end of file
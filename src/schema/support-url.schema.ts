@@ -1,9 +1,7 @@
 import { z } from "zod";  
-import { SUPPORT_SHOP_LIST } from "../constants/support-shop.constant.js";
+import { SUPPORT_SHOP_URL_LIST } from "../constants/support-shop.constant.js";
+import { isShopProductUrl } from "../utils/common.js";
 
 export const SUPPORT_URL_SCHEMA = z.string().url().refine((url) => {
-  const arr = Object.values(SUPPORT_SHOP_LIST);
-  const supportList = arr.map((shop) => shop.url);
-
-  return supportList.some((shopUrl) => url.includes(shopUrl));
+  return SUPPORT_SHOP_URL_LIST.some((shopUrl) => isShopProductUrl(url, shopUrl));
 }, { message: '지원하지 않는 쇼핑몰입니다.' });
\ No newline at end of file
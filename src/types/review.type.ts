@@ -1,6 +1,6 @@
-export type Review = {
+export type Review = Readonly<{
   author: string;
   score: string;
   content: string;
   createdAt: Date;
-}
\ No newline at end of file
+}>
\ No newline at end of file
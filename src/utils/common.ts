@@ -1,12 +1,83 @@
+import path from "path";
+import moment from "moment";
+import { mkdir } from "fs/promises";
 import { SUPPORT_SHOP_LIST } from "../constants/support-shop.constant.js";
 
+export const OUTPUT_DIRECTORY = path.join(process.cwd(), 'output');
+export const RUN_TIMESTAMP = moment().format('YYYY-MM-DD_HH-mm-ss');
+
+const UNSAFE_FILE_NAME_PATTERN = /[^0-9A-Za-z가-힣_-]+/g;
+const CSV_SPECIAL_CHARACTER_PATTERN = /[",\r\n]/;
+const CSV_QUOTE_PATTERN = /"/g;
+
+const SUPPORT_SHOP_ENTRIES = Object.entries(SUPPORT_SHOP_LIST);
+
+const PRODUCT_ID_END_PATTERN = /[/?#]/;
+const POSITIVE_INTEGER_PATTERN = /^(?:\d+|\d{1,3}(?:,\d{3})+)$/;
+const THOUSANDS_SEPARATOR_PATTERN = /,/g;
+
+const getShopProductId = (url: string, shopUrl: string): string | undefined => {
+  if (!url.startsWith(shopUrl)) return undefined;
+
+  const productId = url.slice(shopUrl.length).split(PRODUCT_ID_END_PATTERN)[0];
+
+  return productId === '' ? undefined : productId;
+}
+
+export const isShopProductUrl = (url: string, shopUrl: string): boolean => {
+  return getShopProductId(url, shopUrl) !== undefined;
+}
+
+const findShopProduct = (url: string): { siteName: string; productId: string } | never => {
+  for (const [siteName, shop] of SUPPORT_SHOP_ENTRIES) {
+    const productId = getShopProductId(url, shop.url);
+
+    if (productId !== undefined) return { siteName, productId };
+  }
+
+  throw new Error('지원하지 않는 쇼핑몰입니다.');
+}
+
 export const getSiteName = (url: string): string | never => {
-  const arr = Object.entries(SUPPORT_SHOP_LIST);
-  const supportList = arr.map(([key, { url }]) => [key, url]);
+  return findShopProduct(url).siteName;
+}
+
+export const getProductId = (url: string): string | never => {
+  return findShopProduct(url).productId;
+}
+
+export const toPositiveInteger = (value: string, message: string): number | never => {
+  if (!POSITIVE_INTEGER_PATTERN.test(value)) throw new Error(message);
+
+  const number = Number(value.replace(THOUSANDS_SEPARATOR_PATTERN, ''));
+
+  if (!Number.isSafeInteger(number) || number <= 0) throw new Error(message);
+
+  return number;
+}
+
+let outputDirectory: Promise<string> | undefined;
+
+export const ensureOutputDirectory = (): Promise<string> => {
+  outputDirectory ??= mkdir(OUTPUT_DIRECTORY, { recursive: true }).then(
+    () => OUTPUT_DIRECTORY,
+    (error) => {
+      outputDirectory = undefined;
+      throw error;
+    },
+  );
+
+  return outputDirectory;
+}
+
+export const toSafeFileName = (name: string): string => {
+  return name.replace(UNSAFE_FILE_NAME_PATTERN, '_').slice(0, 50);
+}
 
-  const siteName = supportList.find(([key, url]) => url.includes(url));
+export const escapeCSVField = (value: unknown): string => {
+  const text = String(value);
 
-  if (siteName === undefined) throw new Error('지원하지 않는 쇼핑몰입니다.');
+  if (!CSV_SPECIAL_CHARACTER_PATTERN.test(text)) return text;
 
-  return siteName[0];
+  return `"${text.replace(CSV_QUOTE_PATTERN, '""')}"`;
 }
\ No newline at end of file
@@ -0,0 +1,17 @@
+import type { Locator } from "playwright";
+
+export const extractFields = async <T extends Record<string, string>>(locator: Locator, fieldSelectors: T) => {
+  const rows = await locator.evaluateAll((elements, selectors) => {
+    return elements.map((element) => {
+      const row: Record<string, string | null> = {};
+
+      for (const key of Object.keys(selectors)) {
+        row[key] = element.querySelector(selectors[key])?.textContent?.trim() ?? null;
+      }
+
+      return row;
+    });
+  }, fieldSelectors as Record<string, string>);
+
+  return rows as Record<keyof T, string | null>[];
+}
\ No newline at end of file
@@ -0,0 +1,20 @@
+import { AsyncLocalStorage } from "async_hooks";
+
+const IS_DEBUG = process.env.CRAWLER_DEBUG === "1";
+
+const logContext = new AsyncLocalStorage<string>();
+
+export const runWithLogContext = <T>(label: string, callback: () => Promise<T>) => {
+  return logContext.run(label, callback);
+}
+
+export const log = (...messages: unknown[]) => {
+  const label = logContext.getStore();
+
+  if (label === undefined) console.log(...messages);
+  else console.log(`[${label}]`, ...messages);
+}
+
+export const debug = (...messages: unknown[]) => {
+  if (IS_DEBUG) log(...messages);
+}
\ No newline at end of file